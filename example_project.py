@@ -10,6 +10,7 @@ PyPV-Eval 项目计算脚本示例
     python example_project.py
 """
 
+import logging
 import sys
 from main import PVProject, goal_seek_investment, sensitivity_analysis
 
@@ -198,6 +199,7 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
     try:
         main()
     except Exception as e:
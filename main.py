@@ -6,12 +6,26 @@
 
 from __future__ import annotations
 
+import csv
 import logging
-from typing import Dict, Any, Optional
+import math
+import os
+from typing import Dict, Any, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
-import numpy_financial as npf
-from scipy import optimize
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba 为可选依赖，未安装时内核以纯 NumPy 运行
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba.njit 的占位装饰器，原样返回被装饰函数"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # ==============================================================================
 # 常量定义 (提取魔法数字)
@@ -53,9 +67,43 @@ class Constants:
     # Goal Seek 求解范围
     MIN_INVEST = 1000     # 最小投资 (万元)
     MAX_INVEST = 100000   # 最大投资 (万元)
+    GOAL_SEEK_XTOL = 1e-4     # 割线法与区间法的收敛精度 (万元)，远小于结果的报告精度 0.01 万元
+
+
+# 运营期逐年查表数组 (第 i 项对应运营期第 i+1 年)，导入时计算一次
+_OP_YEARS = np.arange(1, Constants.OPERATION_PERIOD + 1)
+
+# 阶梯运维费率 (元/kWp)，依据 NB/T 11894 附录A 表A.1.1，第 i 项为运营期第 i+1 年
+_OM_RATE_BY_YEAR = np.select(
+    [(_OP_YEARS >= start) & (_OP_YEARS <= end) for start, end in Constants.OM_RATES],
+    list(Constants.OM_RATES.values()),
+    default=Constants.OM_RATES[(21, 25)]  # 默认返回最高档
+).astype(np.float64)
+
+# 所得税率 (三免三减半政策)
+_TAX_RATE_BY_YEAR = np.select(
+    [_OP_YEARS <= 3, _OP_YEARS <= 6],
+    [0.0, Constants.INCOME_TAX_RATE * 0.5],
+    default=Constants.INCOME_TAX_RATE
+)
 
-# 配置日志
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# 折旧计提标志 (折旧年限内为1，其后为0)
+_DEPREC_MASK = (_OP_YEARS <= Constants.DEPRECIATION_YEARS).astype(float)
+
+# 逐年运维费 (万元/MW) 与逐年折旧率 (占固定资产原值)，供计算内核直接乘用
+_OM_COST_PER_MW = _OM_RATE_BY_YEAR * 1000 / 10000
+_DEPREC_RATE_BY_YEAR = (
+    Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS * _DEPREC_MASK
+)
+
+# 各年之前已运营的年数 (各年销项税相同，年初累计销项税 = 年销项税 × 此值)
+_PRIOR_YEARS = (_OP_YEARS - 1).astype(np.float64)
+
+# 报表年份标签 (运营期逐年；现金流量表另含建设期)
+_YEAR_LABELS = [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)]
+_YEAR_LABELS_WITH_CONSTRUCTION = ['建设期'] + _YEAR_LABELS
+
+# 日志记录器 (日志输出格式由脚本入口或调用方配置)
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +126,332 @@ class CalculationError(PVProjectError):
     pass
 
 
+# ==============================================================================
+# 财务计算工具函数
+# ==============================================================================
+
+# 现金流期数序号 (第0期为建设期)
+_PERIODS = np.arange(Constants.CONSTRUCT_PERIOD + Constants.OPERATION_PERIOD, dtype=np.float64)
+# 折现因子 (1+r)^-t 的指数，预先取负避免每次迭代重新分配
+_NEG_PERIODS = -_PERIODS
+
+
+def _npv(rate: float, cf: np.ndarray) -> float:
+    """净现值 NPV(r) = Σ cf_t / (1+r)^t"""
+    return np.sum(cf / (1 + rate) ** _PERIODS)
+
+
+if NUMBA_AVAILABLE:
+    @njit('UniTuple(f8, 2)(f8[::1], f8)', cache=True)
+    def _discounted_sums(cf: np.ndarray, v: float) -> Tuple[float, float]:
+        """
+        求 Σ cf_t·v^t 与 Σ t·cf_t·v^t (v = 1/(1+r))，折现因子逐期累乘，不分配临时数组
+
+        Args:
+            cf: 逐年净现金流 (C 连续的 float64 数组)，第0项为建设期
+            v: 折现系数 1/(1+r)
+        """
+        disc = 1.0
+        npv = 0.0
+        t_npv = 0.0
+        for t in range(cf.shape[0]):
+            npv += cf[t] * disc
+            t_npv += t * cf[t] * disc
+            disc *= v
+        return npv, t_npv
+else:
+    def _discounted_sums(cf: np.ndarray, v: float) -> Tuple[float, float]:
+        """求 Σ cf_t·v^t 与 Σ t·cf_t·v^t (v = 1/(1+r))，未安装 numba 时以数组运算代替逐期循环"""
+        weighted = cf * v ** _PERIODS
+        return weighted.sum(), weighted @ _PERIODS
+
+
+@njit('f8(f8[::1])', cache=True, error_model='numpy')
+def _irr_newton(cf: np.ndarray) -> float:
+    """
+    Newton 法求解 NPV(r) = 0 (初值 8%)，安装 numba 时编译为机器码
+
+    NPV 与其导数由 _discounted_sums 一次求得:
+    NPV(r) = Σ cf_t·(1+r)^-t，dNPV/dr = -Σ t·cf_t·(1+r)^-t / (1+r)
+
+    Args:
+        cf: 逐年净现金流 (C 连续的 float64 数组)，第0项为建设期
+
+    Returns:
+        内部收益率 (小数)，不收敛或解不合法时返回 nan
+    """
+    rate = 0.08
+    for _ in range(30):
+        v = 1.0 / (1 + rate)
+        npv, t_npv = _discounted_sums(cf, v)
+        step = npv / (-t_npv * v)
+        rate -= step
+        if abs(step) < 1e-7:
+            if np.isfinite(rate) and rate > -1:
+                return rate
+            break
+    return np.nan
+
+
+@njit('f8[:](f8[:, ::1])', cache=True, parallel=True, error_model='numpy')
+def _irr_newton_rows(cf: np.ndarray) -> np.ndarray:
+    """
+    逐行以 _irr_newton 求解多个方案的内部收益率，安装 numba 时各方案多线程并行
+
+    Args:
+        cf: 形如 (N, 26) 的净现金流矩阵 (C 连续)，每行一个方案
+
+    Returns:
+        长度为 N 的内部收益率数组 (小数)，不收敛或解不合法时为 nan
+    """
+    rate = np.empty(cf.shape[0])
+    for i in prange(cf.shape[0]):
+        rate[i] = _irr_newton(cf[i])
+    return rate
+
+
+def _irr(cf: np.ndarray) -> float:
+    """
+    求解内部收益率 IRR
+
+    以 Newton 法 (_irr_newton) 求解 NPV(r) = 0，不收敛时退回 Brent 区间法。
+    相比 numpy_financial.irr (对伴随矩阵求全部特征值)，只需数次 NPV 求值。
+
+    Args:
+        cf: 逐年净现金流，第0项为建设期
+
+    Returns:
+        内部收益率 (小数)，无解时返回 nan
+    """
+    cf = np.ascontiguousarray(cf, dtype=np.float64)  # _irr_newton 按 C 连续数组编译
+    # 现金流无正负号变化时 NPV 恒不为零，不存在 IRR，免去迭代与区间求解
+    if not (cf.max() > 0 and cf.min() < 0):
+        return float('nan')
+
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        rate = _irr_newton(cf)
+        if np.isfinite(rate):
+            return float(rate)
+
+        from scipy import optimize  # 仅 Newton 不收敛时需要，延迟导入以缩短模块加载时间
+
+        try:
+            return optimize.brentq(_npv, -0.99, 10.0, args=(cf,))
+        except ValueError:
+            return float('nan')
+
+
+def _irr_rows(cf: np.ndarray, tol: float = 1e-7, maxiter: int = 30) -> np.ndarray:
+    """
+    批量求解多个方案的内部收益率
+
+    安装 numba 时由 _irr_newton_rows 并行逐方案迭代 (收敛条件同 _irr_newton)，
+    否则对所有方案同时执行向量化 Newton 迭代；未收敛的方案逐个退回 _irr 求解，
+    现金流无正负号变化的方案直接记为 nan。
+
+    Args:
+        cf: 形如 (N, 26) 的净现金流矩阵，每行一个方案
+
+    Returns:
+        长度为 N 的内部收益率数组 (小数)，无解时为 nan
+    """
+    # 现金流无正负号变化的方案不存在 IRR，不参与收敛判断，也不逐个回退
+    solvable = (cf.max(axis=1) > 0) & (cf.min(axis=1) < 0)
+    if NUMBA_AVAILABLE:
+        # 编译后逐方案迭代，各方案收敛即停，不必等待最慢的方案
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            rate = _irr_newton_rows(np.ascontiguousarray(cf, dtype=np.float64))
+        rate[~solvable] = np.nan
+        for i in np.flatnonzero(solvable & np.isnan(rate)):
+            rate[i] = _irr(cf[i])
+        return rate
+
+    rate = np.full(cf.shape[0], 0.08)
+    converged = ~solvable
+    t_cf = _PERIODS * cf
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        for _ in range(maxiter):
+            disc = (1 + rate[:, None]) ** _NEG_PERIODS
+            npv = np.sum(cf * disc, axis=1)
+            dnpv = -np.sum(t_cf * disc, axis=1) / (1 + rate)
+            step = npv / dnpv
+            rate = rate - step
+            converged = (np.abs(step) < tol) | ~solvable
+            if converged.all():
+                break
+
+    rate[~solvable] = np.nan
+    valid = converged & np.isfinite(rate) & (rate > -1)
+    for i in np.flatnonzero(solvable & ~valid):
+        rate[i] = _irr(cf[i])
+    return rate
+
+
+def _payback_rows(cf: np.ndarray) -> np.ndarray:
+    """
+    批量计算静态投资回收期
+
+    在累计净现金流首次转正的年份内线性插值。
+
+    Args:
+        cf: 形如 (N, 26) 的净现金流矩阵，每行一个方案
+
+    Returns:
+        长度为 N 的投资回收期数组 (年)，运营期内无法收回投资的方案为 nan
+    """
+    cumsum = np.cumsum(cf, axis=1)
+    recovered = cumsum >= 0
+    p_idx = np.argmax(recovered, axis=1)
+    rows = np.arange(cf.shape[0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payback = p_idx - 1 + np.abs(cumsum[rows, p_idx - 1]) / cf[rows, p_idx]
+    payback = np.where(p_idx == 0, 1.0, payback)
+    return np.where(recovered[rows, p_idx], payback, np.nan)
+
+
+# ==============================================================================
+# 现金流计算内核
+# ==============================================================================
+
+# 内核所用常量 (numba 无法读取类属性，在此展开为模块级标量)
+_OPERATION_PERIOD = Constants.OPERATION_PERIOD
+_OTHER_COST_RATIO = Constants.OTHER_COST_RATIO
+_SURTAX_RATE = Constants.SURTAX_RATE
+_RESIDUAL_RATIO = Constants.RESIDUAL_RATIO
+
+# 现金流表各列 (与 _cash_flow_core 输出的第一维一一对应)
+_CASH_FLOW_COLUMNS = (
+    'Generation', 'Revenue_Inc', 'Revenue_Exc', 'Output_VAT',
+    'OM_Cost', 'VAT_Payable', 'Surtax', 'Total_Cost',
+    'Profit_Total', 'Income_Tax', 'Net_CF_Pre', 'Net_CF_After'
+)
+
+
+@njit('f8[:, :, ::1](' + ', '.join(['f8[:]'] * 9) + ')', cache=True)
+def _cash_flow_core(
+    capacity: np.ndarray,
+    static_invest: np.ndarray,
+    const_interest: np.ndarray,
+    working_capital: np.ndarray,
+    deductible_tax: np.ndarray,
+    generation: np.ndarray,
+    rev_inc: np.ndarray,
+    rev_exc: np.ndarray,
+    output_vat: np.ndarray
+) -> np.ndarray:
+    """
+    现金流计算内核 (纯数值，安装 numba 时于导入时按签名编译为机器码，
+    cache=True 时直接加载磁盘缓存)
+
+    所有参数均为长度 N 的一维数组，每个元素对应一个方案:
+    装机容量 (MW)、静态投资、建设期利息、流动资金、可抵扣进项税、
+    年发电量 (MWh)、年营业收入含税/不含税、年销项税额 (金额单位万元)。
+
+    Returns:
+        形如 (12, N, 26) 的数组，第一维按 _CASH_FLOW_COLUMNS 排列，第0期为建设期
+    """
+    n_scenarios = capacity.shape[0]
+    n_years = _OPERATION_PERIOD
+    out = np.zeros((12, n_scenarios, n_years + 1))
+
+    # 各方案参数取 (N, 1) 列向量，与长度25的逐年费率表广播为 (N, 25)，
+    # 全部方案一次整体运算，不逐方案循环
+    vat = output_vat[:, None]
+
+    # 1. 发电与收入 (各年相同)
+    out[0, :, 1:] = generation[:, None]
+    out[1, :, 1:] = rev_inc[:, None]
+    out[2, :, 1:] = rev_exc[:, None]
+    out[3, :, 1:] = vat
+
+    # 2. 成本 (运维 + 其他)
+    om_cost = capacity[:, None] * _OM_COST_PER_MW + (static_invest * _OTHER_COST_RATIO)[:, None]
+    out[4, :, 1:] = om_cost
+
+    # 3. 税务 (增值税抵扣池逻辑)
+    # 闭式计算: 当年可抵扣额 = min(当年销项税, 年初抵扣池余额)，
+    # 年初余额 = max(0, 可抵扣进项税 - 此前累计销项税)
+    pool_before = np.maximum(0.0, deductible_tax[:, None] - vat * _PRIOR_YEARS)
+    vat_pay = vat - np.minimum(vat, pool_before)
+    surtax = vat_pay * _SURTAX_RATE
+    out[5, :, 1:] = vat_pay
+    out[6, :, 1:] = surtax
+
+    # 4. 利润与所得税
+    fixed_asset_value = static_invest + const_interest - deductible_tax
+    depreciation = fixed_asset_value[:, None] * _DEPREC_RATE_BY_YEAR
+    profit = rev_exc[:, None] - om_cost - surtax - depreciation
+
+    # 三免三减半政策
+    income_tax = np.maximum(0.0, profit * _TAX_RATE_BY_YEAR)
+    out[9, :, 1:] = income_tax
+
+    # 5. 现金流合成 (第0期为建设期投入，末年回收残值与流动资金)
+    net_cf_pre = rev_exc[:, None] - (om_cost + surtax)
+    net_cf_pre[:, -1] += static_invest * _RESIDUAL_RATIO + working_capital
+    initial_outlay = -(static_invest + working_capital)
+    out[10, :, 0] = initial_outlay
+    out[10, :, 1:] = net_cf_pre
+    out[11, :, 0] = initial_outlay
+    out[11, :, 1:] = net_cf_pre - income_tax
+
+    return out
+
+
+def _cash_flow_buffer(*inputs) -> np.ndarray:
+    """
+    计算现金流缓冲区
+
+    Args:
+        inputs: _cash_flow_core 的参数，可为标量 (单个方案) 或长度 N 的数组
+
+    Returns:
+        形如 (12, N, 26) 的数组，第一维按 _CASH_FLOW_COLUMNS 排列，第0期为建设期
+    """
+    columns = [np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in inputs]
+    return _cash_flow_core(*columns)
+
+
+def _cash_flow_kernel(*inputs) -> Dict[str, np.ndarray]:
+    """
+    计算现金流各列数组
+
+    Args:
+        inputs: _cash_flow_core 的参数，可为标量 (单个方案) 或长度 N 的数组
+
+    Returns:
+        现金流各列数组，每列形如 (N, 26)，第0期为建设期
+    """
+    return dict(zip(_CASH_FLOW_COLUMNS, _cash_flow_buffer(*inputs)))
+
+
+# ==============================================================================
+# 报表输出
+# ==============================================================================
+
+def _write_csv(table: pd.DataFrame, filename: str) -> None:
+    """
+    将报表写出为 CSV (UTF-8 BOM，不含索引)
+
+    输出与 table.to_csv(filename, index=False, encoding='utf-8-sig') 逐字节一致，
+    但报表仅数十行，直接用 csv.writer 写出省去 pandas 的类型分派与格式化开销。
+
+    Args:
+        table: 报表 DataFrame
+        filename: 输出文件名
+    """
+    columns = [
+        ['' if v is None or (isinstance(v, float) and math.isnan(v)) else v
+         for v in table[col].tolist()]
+        for col in table.columns
+    ]
+    with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f, lineterminator=os.linesep)  # 与 to_csv 默认的换行符一致
+        writer.writerow(table.columns)
+        writer.writerows(zip(*columns))
+
+
 # ==============================================================================
 # 核心类
 # ==============================================================================
@@ -99,6 +473,9 @@ class PVProject:
         loan_rate: 长期贷款利率
         capital_ratio: 资本金比例
         mode: 收益模式 ('full_grid' 或 'self_consumption')
+        deductible_tax: 可抵扣进项税 (万元)，未给定时按静态投资估算
+        fixed_asset_value: 固定资产原值 (万元)，静态投资 + 建设期利息 - 可抵扣进项税
+        working_capital: 流动资金 (万元)
     """
 
     def __init__(self, params: Dict[str, Any]) -> None:
@@ -130,9 +507,28 @@ class PVProject:
         """
         self.p = params.copy()
         self._validate_and_init_params()
-        self.df: Optional[pd.DataFrame] = None
+        self._buffer: Optional[np.ndarray] = None  # 现金流缓冲区 (12, 26)，行按 _CASH_FLOW_COLUMNS 排列
+        self._arrays: Optional[Dict[str, np.ndarray]] = None  # 现金流各列数组 (长度26)，为 _buffer 各行的视图
+        self._df: Optional[pd.DataFrame] = None
+        self._metrics: Optional[Dict[str, float]] = None  # get_metrics() 结果缓存，现金流重算时失效
         self.total_invest: float = 0.0
-        self.const_interest: float = 0.0
+
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """
+        现金流表 DataFrame
+
+        由 calculate_cash_flow() 计算的数组按需组装，仅在首次访问时构建。
+        尚未计算现金流时为 None。
+        """
+        if self._arrays is None:
+            return None
+        if self._df is None:
+            years = np.arange(1, Constants.OPERATION_PERIOD + 2)
+            self._df = pd.DataFrame(
+                self._buffer.T, columns=list(_CASH_FLOW_COLUMNS), index=years, copy=True
+            )
+        return self._df
 
     def _validate_and_init_params(self) -> None:
         """参数校验与标准化"""
@@ -169,15 +565,20 @@ class PVProject:
         if not 0 < self.capital_ratio <= 1:
             raise InputValidationError("资本金比例必须在 (0, 1] 范围内")
 
-        # 预计算贷款本金
+        # 预计算资本金、贷款本金、建设期利息、可抵扣进项税与固定资产原值
+        self.capital_amount = self.static_invest * self.capital_ratio
         self.loan_principal = self.static_invest * (1 - self.capital_ratio)
+        self.const_interest = self._calc_construction_interest()
+        self.deductible_tax = self._calc_deductible_tax()
+        self.fixed_asset_value = self.static_invest + self.const_interest - self.deductible_tax
+        self._depreciation: Optional[np.ndarray] = None
 
         # 根据模式验证特定参数
         if self.mode == Constants.MODE_FULL_GRID:
             if 'price_tax_inc' not in self.p:
                 raise InputValidationError("全额上网模式需要参数: price_tax_inc")
             self.price_tax_inc = float(self.p['price_tax_inc'])
-            logger.info(f"模式: 全额上网, 电价={self.price_tax_inc}元/kWh")
+            logger.info("模式: 全额上网, 电价=%s元/kWh", self.price_tax_inc)
 
         elif self.mode == Constants.MODE_SELF_CONSUMPTION:
             required_sc_keys = ['self_consumption_ratio', 'retail_price', 'feedin_price']
@@ -194,11 +595,43 @@ class PVProject:
                 raise InputValidationError("自用比例必须在 [0, 1] 范围内")
 
             logger.info(
-                f"模式: 自发自用, 自用比例={self.self_consumption_ratio:.1%}, "
-                f"零售电价={self.retail_price}元/kWh, 上网电价={self.feedin_price}元/kWh"
+                "模式: 自发自用, 自用比例=%.1f%%, 零售电价=%s元/kWh, 上网电价=%s元/kWh",
+                self.self_consumption_ratio * 100, self.retail_price, self.feedin_price
             )
 
-        logger.info(f"项目参数验证通过: 容量={self.capacity}MW, 投资={self.static_invest}万元")
+        # 与静态投资无关的现金流分量 (反向求解各次迭代间保持不变)，一次性计算
+        self.working_capital = self.capacity * Constants.WORKING_CAPITAL_PER_MW
+        self._revenue = self._annual_revenue()
+
+        logger.info("项目参数验证通过: 容量=%sMW, 投资=%s万元", self.capacity, self.static_invest)
+
+    def set_static_invest(self, static_invest: float) -> None:
+        """
+        修改静态投资并更新其派生参数，已计算的现金流随之失效
+
+        供反向求解在迭代间复用同一项目实例，免去重复的参数复制与校验。
+
+        Args:
+            static_invest: 静态投资 (万元)
+
+        Raises:
+            InputValidationError: 静态投资不大于0
+        """
+        static_invest = float(static_invest)
+        if static_invest <= 0:
+            raise InputValidationError("静态投资必须大于0")
+        self.p['static_invest'] = static_invest
+        self.static_invest = static_invest
+        self.capital_amount = static_invest * self.capital_ratio
+        self.loan_principal = static_invest * (1 - self.capital_ratio)
+        self.const_interest = self._calc_construction_interest()
+        self.deductible_tax = self._calc_deductible_tax()
+        self.fixed_asset_value = static_invest + self.const_interest - self.deductible_tax
+        self._depreciation = None
+        self._buffer = None
+        self._arrays = None
+        self._df = None
+        self._metrics = None
 
     def _calc_construction_interest(self) -> float:
         """
@@ -214,27 +647,168 @@ class PVProject:
         interest = (self.loan_principal / 2) * self.loan_rate
         return interest
 
-    def _get_om_rate(self, year_idx: int) -> float:
+    def _calc_deductible_tax(self) -> float:
+        """
+        确定可抵扣进项税
+
+        依据: NB/T 11894 3.2.6
+        未给定 deductible_tax 参数时按静态投资含13%增值税估算
+
+        Returns:
+            可抵扣进项税 (万元)
+        """
+        if 'deductible_tax' in self.p:
+            return float(self.p['deductible_tax'])
+        return self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
+
+    def _annual_revenue(self) -> Tuple[float, float, float, float]:
         """
-        获取阶梯运维费率
+        计算运营期年发电量与年收入 (各年相同)
 
-        依据: NB/T 11894 附录A 表A.1.1
+        Returns:
+            (发电量 MWh, 营业收入含税, 营业收入不含税, 销项税额)，金额单位万元
+        """
+        generation = self.capacity * self.gen_hours  # MWh
+
+        if self.mode == Constants.MODE_FULL_GRID:
+            # 全额上网模式：全部发电量按上网电价计算
+            rev_inc = generation * 1000 * self.price_tax_inc / 10000  # 万元
+            rev_exc = rev_inc / (1 + Constants.VAT_RATE)
+            output_vat = rev_inc - rev_exc
+
+        else:  # MODE_SELF_CONSUMPTION
+            # 自发自用模式：拆分为自用和余电两部分
+            self_consumed_mwh = generation * self.self_consumption_ratio
+            surplus_mwh = generation * (1 - self.self_consumption_ratio)
+
+            # 自用部分收益 = 避免购电的成本节省（按零售电价）
+            # 注意：自用节省是否涉及VAT处理取决于具体政策
+            # 这里简化处理：自用部分按不含税零售价计算收益
+            rev_self_exc = self_consumed_mwh * 1000 * self.retail_price / 10000 / (1 + Constants.VAT_RATE)
+
+            # 余电上网收益 = 余电 × 上网电价
+            rev_surplus_inc = surplus_mwh * 1000 * self.feedin_price / 10000
+            rev_surplus_exc = rev_surplus_inc / (1 + Constants.VAT_RATE)
+            vat_surplus = rev_surplus_inc - rev_surplus_exc
+
+            # 总收益
+            rev_inc = rev_surplus_inc  # 增值税基数只有余电上网部分
+            rev_exc = rev_self_exc + rev_surplus_exc
+            output_vat = vat_surplus  # 只有余电上网部分产生销项税
+
+            logger.debug(
+                "每年: 发电=%.1fMWh, 自用=%.1fMWh, 余电=%.1fMWh",
+                generation, self_consumed_mwh, surplus_mwh
+            )
+
+        return generation, rev_inc, rev_exc, output_vat
+
+    def _depreciation_schedule(self) -> np.ndarray:
+        """
+        运营期逐年折旧 (与现金流内核同一折旧率表)
+
+        首次调用时计算并缓存，静态投资变化时失效。
+
+        Returns:
+            长度为运营期的逐年折旧数组 (万元)
+        """
+        if self._depreciation is None:
+            self._depreciation = self.fixed_asset_value * _DEPREC_RATE_BY_YEAR
+            self._depreciation.flags.writeable = False
+        return self._depreciation
+
+    def _operating_profit(self) -> np.ndarray:
+        """
+        计算运营期逐年利润总额 (营业收入不含税 - 运维成本 - 附加税 - 折旧)
+
+        Returns:
+            长度为运营期的利润总额数组 (万元)
+        """
+        a = self._arrays
+        depreciation = self._depreciation_schedule()
+        return a['Revenue_Exc'][1:] - a['OM_Cost'][1:] - a['Surtax'][1:] - depreciation
+
+    def _kernel_inputs(self) -> Tuple[float, ...]:
+        """
+        汇总现金流计算内核 _cash_flow_kernel 所需的标量参数
+
+        Returns:
+            按 _cash_flow_kernel 参数顺序排列的元组
+        """
+        return (
+            self.capacity, self.static_invest, self.const_interest, self.working_capital,
+            self.deductible_tax, *self._revenue
+        )
+
+    def _compute_arrays(self) -> None:
+        """运行现金流计算内核，更新现金流数组与总投资 (不组装 DataFrame)"""
+        self._buffer = _cash_flow_buffer(*self._kernel_inputs())[:, 0, :]
+        self._arrays = dict(zip(_CASH_FLOW_COLUMNS, self._buffer))
+        self._df = None
+        self._metrics = None
+        self.total_invest = self.static_invest + self.const_interest + self.working_capital
+
+    def recompute(self, static_invest: float) -> float:
+        """
+        以新的静态投资重新计算现金流并返回全投资IRR(税前)
+
+        反向求解的轻量路径: 只更新静态投资的派生参数并重跑计算内核，
+        不重新校验其余参数、不组装 DataFrame、不输出日志。
 
         Args:
-            year_idx: 运营期第几年 (1-25)
+            static_invest: 静态投资 (万元)
 
         Returns:
-            运维费率 (元/kWp)
+            全投资IRR(税前)，单位 %，未取整
+
+        Raises:
+            InputValidationError: 静态投资不大于0
         """
-        for (start, end), rate in Constants.OM_RATES.items():
-            if start <= year_idx <= end:
-                return rate
-        return Constants.OM_RATES[(21, 25)]  # 默认返回最高档
+        self.set_static_invest(static_invest)
+        self._compute_arrays()
+        return self.get_irr_pre()
+
+    def sweep_static_invest(self, invests: np.ndarray) -> np.ndarray:
+        """
+        批量计算一组静态投资下的全投资IRR(税前)
+
+        各候选投资作为独立方案一次性送入计算内核，IRR 由向量化 Newton 迭代同时求解。
+        不修改当前项目的状态。
+
+        Args:
+            invests: 候选静态投资数组 (万元)
+
+        Returns:
+            与 invests 等长的全投资IRR(税前)数组，单位 %，未取整，无解时为 nan
+
+        Raises:
+            InputValidationError: 存在不大于0的静态投资
+        """
+        invests = np.atleast_1d(np.asarray(invests, dtype=np.float64))
+        if np.any(invests <= 0):
+            raise InputValidationError("静态投资必须大于0")
+
+        # 随静态投资变化的派生参数 (与 _calc_construction_interest / _calc_deductible_tax 一致)
+        const_interest = invests * (1 - self.capital_ratio) / 2 * self.loan_rate
+        if 'deductible_tax' in self.p:
+            deductible_tax = np.full_like(invests, self.deductible_tax)
+        else:
+            deductible_tax = invests / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
+
+        capacity, _, _, working_capital, _, *revenue = (
+            np.full_like(invests, x) for x in self._kernel_inputs()
+        )
+        arrays = _cash_flow_kernel(
+            capacity, invests, const_interest, working_capital, deductible_tax, *revenue
+        )
+        return _irr_rows(arrays['Net_CF_Pre']) * 100
 
     def calculate_cash_flow(self) -> pd.DataFrame:
         """
         核心引擎: 生成25年现金流表
 
+        只需要指标时 (如 get_metrics) 使用不组装 DataFrame 的 _net_cash_flows()。
+
         Returns:
             包含完整现金流数据的DataFrame
 
@@ -242,146 +816,49 @@ class PVProject:
             CalculationError: 计算过程中发生错误
         """
         try:
-            # --- A. 建设期计算 ---
-            const_interest = self._calc_construction_interest()
-            working_capital = self.capacity * Constants.WORKING_CAPITAL_PER_MW
-            total_invest = self.static_invest + const_interest + working_capital
-
-            # 增值税抵扣池初始化 (依据 NB/T 11894 3.2.6)
-            deductible_tax = self.p.get(
-                'deductible_tax',
-                self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-            )
-
-            # --- B. 初始化现金流表 ---
-            years = np.arange(1, Constants.OPERATION_PERIOD + 2)
-            df = pd.DataFrame(index=years)
-
-            cols = [
-                'Generation', 'Revenue_Inc', 'Revenue_Exc', 'Output_VAT',
-                'OM_Cost', 'VAT_Payable', 'Surtax', 'Total_Cost',
-                'Profit_Total', 'Income_Tax', 'Net_CF_Pre', 'Net_CF_After'
-            ]
-            for c in cols:
-                df[c] = 0.0
-
-            # 第1年 (建设期) 现金流出
-            df.loc[1, 'Net_CF_Pre'] = -(self.static_invest + working_capital)
-            df.loc[1, 'Net_CF_After'] = -(self.static_invest + working_capital)
-
-            # --- C. 运营期逐年迭代 ---
-            current_deductible = deductible_tax
-            fixed_asset_value = self.static_invest + const_interest - deductible_tax
-
-            for y in range(2, Constants.OPERATION_PERIOD + 2):
-                op_year = y - 1
-
-                # 1. 发电与收入计算
-                generation = self.capacity * self.gen_hours  # MWh
-
-                if self.mode == Constants.MODE_FULL_GRID:
-                    # 全额上网模式：全部发电量按上网电价计算
-                    price = self.price_tax_inc
-                    rev_inc = generation * 1000 * price / 10000  # 万元
-                    rev_exc = rev_inc / (1 + Constants.VAT_RATE)
-                    output_vat = rev_inc - rev_exc
-
-                else:  # MODE_SELF_CONSUMPTION
-                    # 自发自用模式：拆分为自用和余电两部分
-                    self_consumed_mwh = generation * self.self_consumption_ratio
-                    surplus_mwh = generation * (1 - self.self_consumption_ratio)
-
-                    # 自用部分收益 = 避免购电的成本节省（按零售电价）
-                    # 注意：自用节省是否涉及VAT处理取决于具体政策
-                    # 这里简化处理：自用部分按不含税零售价计算收益
-                    rev_self_exc = self_consumed_mwh * 1000 * self.retail_price / 10000 / (1 + Constants.VAT_RATE)
-
-                    # 余电上网收益 = 余电 × 上网电价
-                    rev_surplus_inc = surplus_mwh * 1000 * self.feedin_price / 10000
-                    rev_surplus_exc = rev_surplus_inc / (1 + Constants.VAT_RATE)
-                    vat_surplus = rev_surplus_inc - rev_surplus_exc
-
-                    # 总收益
-                    rev_inc = rev_surplus_inc  # 增值税基数只有余电上网部分
-                    rev_exc = rev_self_exc + rev_surplus_exc
-                    output_vat = vat_surplus  # 只有余电上网部分产生销项税
-
-                    logger.debug(
-                        f"第{op_year}年: 发电={generation:.1f}MWh, "
-                        f"自用={self_consumed_mwh:.1f}MWh, 余电={surplus_mwh:.1f}MWh"
-                    )
-
-                df.loc[y, 'Generation'] = generation
-                df.loc[y, 'Revenue_Inc'] = rev_inc
-                df.loc[y, 'Revenue_Exc'] = rev_exc
-                df.loc[y, 'Output_VAT'] = output_vat
-
-                # 2. 成本 (运维 + 其他)
-                om_unit = self._get_om_rate(op_year)
-                om_cost = (
-                    self.capacity * 1000 * om_unit / 10000
-                    + self.static_invest * Constants.OTHER_COST_RATIO
-                )
-                df.loc[y, 'OM_Cost'] = om_cost
-
-                # 3. 税务 (增值税抵扣池逻辑)
-                if current_deductible > 0:
-                    if current_deductible >= output_vat:
-                        current_deductible -= output_vat
-                        vat_pay = 0
-                    else:
-                        vat_pay = output_vat - current_deductible
-                        current_deductible = 0
-                else:
-                    vat_pay = output_vat
-
-                df.loc[y, 'VAT_Payable'] = vat_pay
-                surtax = vat_pay * Constants.SURTAX_RATE
-                df.loc[y, 'Surtax'] = surtax
-
-                # 4. 利润与所得税
-                depreciation = (
-                    fixed_asset_value * Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS
-                    if op_year <= Constants.DEPRECIATION_YEARS else 0
-                )
-
-                profit = rev_exc - om_cost - surtax - depreciation
-
-                # 三免三减半政策
-                if op_year <= 3:
-                    tax_rate = 0.0
-                elif op_year <= 6:
-                    tax_rate = Constants.INCOME_TAX_RATE * 0.5
-                else:
-                    tax_rate = Constants.INCOME_TAX_RATE
-
-                income_tax = max(0.0, profit * tax_rate)
-                df.loc[y, 'Income_Tax'] = income_tax
-
-                # 5. 现金流合成
-                inflow = rev_exc
-                if y == Constants.OPERATION_PERIOD + 1:
-                    residual = self.static_invest * Constants.RESIDUAL_RATIO
-                    inflow += residual + working_capital
-
-                outflow = om_cost + surtax
-                df.loc[y, 'Net_CF_Pre'] = inflow - outflow
-                df.loc[y, 'Net_CF_After'] = inflow - outflow - income_tax
-
-            self.df = df
-            self.total_invest = total_invest
-            self.const_interest = const_interest
-
-            logger.info(f"现金流计算完成: 总投资={total_invest:.2f}万元")
-            return df
+            self._compute_arrays()
+            logger.info("现金流计算完成: 总投资=%.2f万元", self.total_invest)
+            return self.df
 
         except Exception as e:
             raise CalculationError(f"现金流计算失败: {e}") from e
 
+    def _net_cash_flows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        现金流快速路径: 只运行计算内核、不组装 DataFrame
+
+        尚未计算时运行计算内核，已计算时直接返回现有数组。
+
+        Returns:
+            (税前净现金流, 税后净现金流)，第0项为建设期
+        """
+        if self._arrays is None:
+            self._compute_arrays()
+        return self._arrays['Net_CF_Pre'], self._arrays['Net_CF_After']
+
+    def get_irr_pre(self) -> float:
+        """
+        仅求解未取整的全投资IRR(税前)，单位 %
+        """
+        return _irr(self._net_cash_flows()[0]) * 100
+
+    def _irrs(self) -> Tuple[float, float]:
+        """
+        计算未取整的税前/税后全投资IRR
+
+        Returns:
+            (全投资IRR(税前), 全投资IRR(税后))，单位 %
+        """
+        cf_pre, cf_after = self._net_cash_flows()
+        return _irr(cf_pre) * 100, _irr(cf_after) * 100
+
     def get_metrics(self) -> Dict[str, float]:
         """
         计算核心指标
 
+        结果在现金流重新计算前缓存，重复调用 (如各报表导出) 不再重复求解 IRR。
+        尚未运行 calculate_cash_flow() 时经 _net_cash_flows() 只计算现金流数组，不组装 DataFrame。
+
         Returns:
             包含以下指标的字典:
                 - 总投资 (万元)
@@ -393,28 +870,20 @@ class PVProject:
         Raises:
             CalculationError: 指标计算失败
         """
-        if self.df is None:
-            raise CalculationError("请先运行 calculate_cash_flow()")
+        if self._metrics is not None:
+            return dict(self._metrics)
 
         try:
-            cf_pre = self.df['Net_CF_Pre'].values
-            cf_after = self.df['Net_CF_After'].values
-
-            irr_pre = npf.irr(cf_pre) * 100
-            irr_after = npf.irr(cf_after) * 100
+            _, cf_after = self._net_cash_flows()
+            irr_pre, irr_after = self._irrs()
 
             # 静态投资回收期计算
-            cumsum = np.cumsum(cf_after)
-            positive_indices = np.where(cumsum >= 0)[0]
-
-            if len(positive_indices) > 0:
-                p_idx = positive_indices[0]
-                payback = p_idx - 1 + abs(cumsum[p_idx - 1]) / cf_after[p_idx] if p_idx > 0 else 1.0
-            else:
+            payback = float(_payback_rows(cf_after[None, :])[0])
+            if np.isnan(payback):
                 logger.warning("项目在运营期内无法收回投资")
                 payback = 99.9
 
-            return {
+            self._metrics = {
                 "总投资": round(self.total_invest, 2),
                 "建设期利息": round(self.const_interest, 2),
                 "全投资IRR(税前)": round(irr_pre, 2),
@@ -425,6 +894,77 @@ class PVProject:
         except Exception as e:
             raise CalculationError(f"指标计算失败: {e}") from e
 
+        return dict(self._metrics)
+
+    @staticmethod
+    def batch_metrics(cf_pre: np.ndarray, cf_after: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        批量计算多个方案的核心指标 (未取整)
+
+        Args:
+            cf_pre: 形如 (N, 26) 的税前净现金流矩阵，每行一个方案
+            cf_after: 形如 (N, 26) 的税后净现金流矩阵
+
+        Returns:
+            各指标长度为 N 的数组:
+                - 全投资IRR(税前) (%)
+                - 全投资IRR(税后) (%)
+                - 投资回收期(年)，运营期内无法收回投资时为 99.9
+        """
+        payback = _payback_rows(np.atleast_2d(cf_after))
+        return {
+            "全投资IRR(税前)": _irr_rows(np.atleast_2d(cf_pre)) * 100,
+            "全投资IRR(税后)": _irr_rows(np.atleast_2d(cf_after)) * 100,
+            "投资回收期(年)": np.where(np.isnan(payback), 99.9, payback),
+        }
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        scenarios: Union[pd.DataFrame, List[Dict[str, Any]]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        批量计算多个方案的核心指标 (未取整)
+
+        各方案逐个校验参数后，现金流一次性送入计算内核并以向量化 Newton 迭代求解 IRR，
+        不组装现金流 DataFrame。适用于蒙特卡洛、拉丁超立方抽样等大样本分析。
+
+        Args:
+            scenarios: 参数字典列表，或每行一个方案、列名为参数名的 DataFrame
+                       (DataFrame 中的缺失值视为未给定该参数)
+
+        Returns:
+            各指标长度为 N 的数组，键与 get_metrics() 相同；参数校验失败的方案各指标为 nan
+        """
+        if isinstance(scenarios, pd.DataFrame):
+            scenarios = [
+                {k: v for k, v in row.items() if not pd.isna(v)}
+                for row in scenarios.to_dict('records')
+            ]
+
+        n_scenarios = len(scenarios)
+        valid = np.zeros(n_scenarios, dtype=bool)
+        kernel_inputs = []
+        for i, params in enumerate(scenarios):
+            try:
+                kernel_inputs.append(cls(params)._kernel_inputs())
+                valid[i] = True
+            except PVProjectError as e:
+                logger.error("方案 %d 参数校验失败: %s", i, e)
+
+        metrics = {
+            key: np.full(n_scenarios, np.nan)
+            for key in ("总投资", "建设期利息", "全投资IRR(税前)", "全投资IRR(税后)", "投资回收期(年)")
+        }
+        if kernel_inputs:
+            capacity, static_invest, const_interest, working_capital, *rest = np.array(kernel_inputs).T
+            arrays = _cash_flow_kernel(capacity, static_invest, const_interest, working_capital, *rest)
+            metrics["总投资"][valid] = static_invest + const_interest + working_capital
+            metrics["建设期利息"][valid] = const_interest
+            for key, values in cls.batch_metrics(arrays['Net_CF_Pre'], arrays['Net_CF_After']).items():
+                metrics[key][valid] = values
+        return metrics
+
     # ==============================================================================
     # 财务报表输出方法
     # ==============================================================================
@@ -441,26 +981,26 @@ class PVProject:
         Returns:
             收入和税金表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        # 提取运营期数据
-        df = self.df[self.df.index >= 2].copy()
+        # 提取运营期数据 (去除建设期的数组视图)
+        op = {col: values[1:] for col, values in self._arrays.items()}
 
         # 创建收入和税金表
         table = pd.DataFrame({
-            '年份': [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '发电量(MWh)': df['Generation'].values,
-            '营业收入(含税,万元)': df['Revenue_Inc'].values,
-            '营业收入(不含税,万元)': df['Revenue_Exc'].values,
-            '增值税(万元)': df['Output_VAT'].values,
-            '增值税实缴(万元)': df['VAT_Payable'].values,
-            '附加税(万元)': df['Surtax'].values,
+            '年份': _YEAR_LABELS,
+            '发电量(MWh)': op['Generation'],
+            '营业收入(含税,万元)': op['Revenue_Inc'],
+            '营业收入(不含税,万元)': op['Revenue_Exc'],
+            '增值税(万元)': op['Output_VAT'],
+            '增值税实缴(万元)': op['VAT_Payable'],
+            '附加税(万元)': op['Surtax'],
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"收入和税金表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("收入和税金表已保存到: %s", filename)
 
         return table
 
@@ -476,39 +1016,31 @@ class PVProject:
         Returns:
             总成本费用表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df[self.df.index >= 2].copy()
+        # 提取运营期数据 (去除建设期的数组视图)
+        op = {col: values[1:] for col, values in self._arrays.items()}
 
         # 重新计算折旧
-        deductible_tax = self.p.get(
-            'deductible_tax',
-            self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-        )
-        const_interest = self.const_interest
-        fixed_asset_value = self.static_invest + const_interest - deductible_tax
-
-        depreciation_per_year = fixed_asset_value * Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS
+        depreciation = self._depreciation_schedule()
 
         # 创建总成本费用表
         table = pd.DataFrame({
-            '年份': [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '运维成本(万元)': df['OM_Cost'].values,
-            '折旧费(万元)': [depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
-                            for i in range(1, Constants.OPERATION_PERIOD + 1)],
+            '年份': _YEAR_LABELS,
+            '运维成本(万元)': op['OM_Cost'],
+            '折旧费(万元)': depreciation,
             '摊销费(万元)': [0.0] * Constants.OPERATION_PERIOD,
             '财务费用(万元)': [0.0] * Constants.OPERATION_PERIOD,  # 融资前分析
-            '总成本费用(万元)': df['OM_Cost'].values + [depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
-                            for i in range(1, Constants.OPERATION_PERIOD + 1)],
+            '总成本费用(万元)': op['OM_Cost'] + depreciation,
         })
 
         # 经营成本 = 总成本 - 折旧 - 摊销 - 财务费用
         table['经营成本(万元)'] = table['运维成本(万元)']
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"总成本费用表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("总成本费用表已保存到: %s", filename)
 
         return table
 
@@ -524,45 +1056,33 @@ class PVProject:
         Returns:
             利润表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df[self.df.index >= 2].copy()
-
-        # 重新计算折旧
-        deductible_tax = self.p.get(
-            'deductible_tax',
-            self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-        )
-        const_interest = self.const_interest
-        fixed_asset_value = self.static_invest + const_interest - deductible_tax
-        depreciation_per_year = fixed_asset_value * Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS
+        # 提取运营期数据 (去除建设期的数组视图)
+        op = {col: values[1:] for col, values in self._arrays.items()}
 
-        # 计算利润
-        profit_list = []
-        for i in range(1, Constants.OPERATION_PERIOD + 1):
-            depreciation = depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
-            profit = df.loc[i + 1, 'Revenue_Exc'] - df.loc[i + 1, 'OM_Cost'] - df.loc[i + 1, 'Surtax'] - depreciation
-            profit_list.append(profit)
+        # 重新计算折旧与利润
+        depreciation_by_year = self._depreciation_schedule()
+        profit = self._operating_profit()
 
         # 创建利润表
         table = pd.DataFrame({
-            '年份': [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '营业收入(不含税,万元)': df['Revenue_Exc'].values,
-            '营业税金及附加(万元)': df['Surtax'].values,
-            '总成本费用(万元)': df['OM_Cost'].values + [depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
-                            for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '利润总额(万元)': profit_list,
-            '所得税(万元)': df['Income_Tax'].values,
-            '净利润(万元)': [p - t for p, t in zip(profit_list, df['Income_Tax'].values)],
+            '年份': _YEAR_LABELS,
+            '营业收入(不含税,万元)': op['Revenue_Exc'],
+            '营业税金及附加(万元)': op['Surtax'],
+            '总成本费用(万元)': op['OM_Cost'] + depreciation_by_year,
+            '利润总额(万元)': profit,
+            '所得税(万元)': op['Income_Tax'],
+            '净利润(万元)': profit - op['Income_Tax'],
         })
 
         # 累计净利润
         table['累计净利润(万元)'] = table['净利润(万元)'].cumsum()
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"利润表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("利润表已保存到: %s", filename)
 
         return table
 
@@ -578,62 +1098,31 @@ class PVProject:
         Returns:
             投资计划表 DataFrame
         """
-        # 建设期利息
         const_interest = self.const_interest
-        working_capital = self.capacity * Constants.WORKING_CAPITAL_PER_MW
-
-        # 创建投资计划表
-        table = pd.DataFrame({
-            '项目': [
-                '建设投资',
-                '建设期利息',
-                '流动资金',
-                '项目总投资'
-            ],
-            '合计(万元)': [
-                self.static_invest,
-                const_interest,
-                working_capital,
-                self.total_invest
-            ],
-            '第1年(万元)': [
-                self.static_invest,
-                const_interest,
-                working_capital,
-                self.static_invest + const_interest + working_capital
-            ]
-        })
-
-        # 资本金和银行贷款
-        capital_amount = self.static_invest * self.capital_ratio
-        loan_amount = self.static_invest * (1 - self.capital_ratio)
-        loan_with_interest = loan_amount + const_interest
-
-        # 添加筹措部分
-        funding_df = pd.DataFrame({
-            '项目': [
-                '项目资本金',
-                '银行贷款',
-                '资金筹措合计'
-            ],
-            '合计(万元)': [
-                capital_amount + working_capital * self.capital_ratio,  # 假设流动资金也按相同比例
-                loan_with_interest + working_capital * (1 - self.capital_ratio),
-                capital_amount + working_capital + loan_with_interest
-            ],
-            '第1年(万元)': [
-                capital_amount + working_capital * self.capital_ratio,
-                loan_with_interest + working_capital * (1 - self.capital_ratio),
-                capital_amount + working_capital + loan_with_interest
-            ]
-        })
-
-        table = pd.concat([table, pd.DataFrame({'项目': [''], '合计(万元)': [''], '第1年(万元)': ['']})], ignore_index=True)
-        table = pd.concat([table, funding_df], ignore_index=True)
+        working_capital = self.working_capital
+
+        # 资本金和银行贷款 (假设流动资金也按资本金比例筹措)
+        loan_with_interest = self.loan_principal + const_interest
+        capital_total = self.capital_amount + working_capital * self.capital_ratio
+        loan_total = loan_with_interest + working_capital * (1 - self.capital_ratio)
+        funding_total = self.capital_amount + working_capital + loan_with_interest
+
+        # 投资使用计划、空行分隔、资金筹措，各行为 (项目, 合计, 第1年)
+        rows = [
+            ('建设投资', self.static_invest, self.static_invest),
+            ('建设期利息', const_interest, const_interest),
+            ('流动资金', working_capital, working_capital),
+            ('项目总投资', self.total_invest, self.static_invest + const_interest + working_capital),
+            ('', '', ''),
+            ('项目资本金', capital_total, capital_total),
+            ('银行贷款', loan_total, loan_total),
+            ('资金筹措合计', funding_total, funding_total),
+        ]
+        table = pd.DataFrame(rows, columns=['项目', '合计(万元)', '第1年(万元)'])
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"投资计划表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("投资计划表已保存到: %s", filename)
 
         return table
 
@@ -649,27 +1138,29 @@ class PVProject:
         Returns:
             财务现金流量表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df.copy()
+        a = self._arrays
+        net_cf = a['Net_CF_After']
+
+        # 运营期现金流入 (末年含残值与流动资金回收) 与现金流出
+        inflow = a['Revenue_Exc'][1:].copy()
+        inflow[-1] += self.static_invest * Constants.RESIDUAL_RATIO + self.working_capital
+        outflow = a['OM_Cost'][1:] + a['Surtax'][1:] + a['Income_Tax'][1:]
 
         # 创建财务现金流量表
         table = pd.DataFrame({
-            '年份': ['建设期'] + [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '现金流入(万元)': [0] + list(df.loc[2:, 'Revenue_Exc'].values) + [df.loc[Constants.OPERATION_PERIOD + 1, 'Revenue_Exc'] +
-                self.static_invest * Constants.RESIDUAL_RATIO + self.capacity * Constants.WORKING_CAPITAL_PER_MW],
-            '现金流出(万元)': [df.loc[1, 'Net_CF_After']] + list(
-                (df.loc[2:, 'OM_Cost'] + df.loc[2:, 'Surtax'] + df.loc[2:, 'Income_Tax'] +
-                 df.loc[2:, 'OM_Cost'] * 0).values) + [df.loc[Constants.OPERATION_PERIOD + 1, 'OM_Cost'] +
-                df.loc[Constants.OPERATION_PERIOD + 1, 'Surtax'] + df.loc[Constants.OPERATION_PERIOD + 1, 'Income_Tax']],
-            '净现金流量(万元)': [df.loc[1, 'Net_CF_After']] + list(df.loc[2:, 'Net_CF_After'].values),
-            '累计净现金流量(万元)': [df.loc[1, 'Net_CF_After']] + list(df.loc[2:, 'Net_CF_After'].cumsum().values),
+            '年份': _YEAR_LABELS_WITH_CONSTRUCTION,
+            '现金流入(万元)': np.concatenate(([0.0], inflow)),
+            '现金流出(万元)': np.concatenate((net_cf[:1], outflow)),
+            '净现金流量(万元)': net_cf,
+            '累计净现金流量(万元)': np.cumsum(net_cf),
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"财务现金流量表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("财务现金流量表已保存到: %s", filename)
 
         return table
 
@@ -685,25 +1176,28 @@ class PVProject:
         Returns:
             项目投资现金流量表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df.copy()
+        a = self._arrays
+        net_cf = a['Net_CF_Pre']
+
+        # 运营期现金流入 (末年含残值与流动资金回收) 与现金流出 (不含所得税)
+        inflow = a['Revenue_Exc'][1:].copy()
+        inflow[-1] += self.static_invest * Constants.RESIDUAL_RATIO + self.working_capital
+        outflow = a['OM_Cost'][1:] + a['Surtax'][1:]
 
         table = pd.DataFrame({
-            '年份': ['建设期'] + [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '现金流入(万元)': [0] + list(df.loc[2:, 'Revenue_Exc'].values) + [df.loc[Constants.OPERATION_PERIOD + 1, 'Revenue_Exc'] +
-                self.static_invest * Constants.RESIDUAL_RATIO + self.capacity * Constants.WORKING_CAPITAL_PER_MW],
-            '现金流出(万元)': [df.loc[1, 'Net_CF_Pre']] + list(
-                (df.loc[2:, 'OM_Cost'] + df.loc[2:, 'Surtax']).values) + [df.loc[Constants.OPERATION_PERIOD + 1, 'OM_Cost'] +
-                df.loc[Constants.OPERATION_PERIOD + 1, 'Surtax']],
-            '所得税前净现金流量(万元)': [df.loc[1, 'Net_CF_Pre']] + list(df.loc[2:, 'Net_CF_Pre'].values),
-            '累计所得税前净现金流量(万元)': [df.loc[1, 'Net_CF_Pre']] + list(df.loc[2:, 'Net_CF_Pre'].cumsum().values),
+            '年份': _YEAR_LABELS_WITH_CONSTRUCTION,
+            '现金流入(万元)': np.concatenate(([0.0], inflow)),
+            '现金流出(万元)': np.concatenate((net_cf[:1], outflow)),
+            '所得税前净现金流量(万元)': net_cf,
+            '累计所得税前净现金流量(万元)': np.cumsum(net_cf),
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"项目投资现金流量表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("项目投资现金流量表已保存到: %s", filename)
 
         return table
 
@@ -719,30 +1213,30 @@ class PVProject:
         Returns:
             资本金现金流量表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df.copy()
-
         # 资本金投入
-        capital_invest = self.static_invest * self.capital_ratio
-        working_capital = self.capacity * Constants.WORKING_CAPITAL_PER_MW
+        equity_outlay = -(self.capital_amount + self.working_capital * self.capital_ratio)
+
+        # 运营期税后净现金流 (末年已含残值与流动资金回收)
+        operating_cf = self._arrays['Net_CF_After'][1:]
+        net_cf = np.concatenate(([equity_outlay], operating_cf))
 
         table = pd.DataFrame({
-            '年份': ['建设期'] + [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '现金流入(万元)': [0] + list(df.loc[2:, 'Net_CF_After'].values) + [df.loc[Constants.OPERATION_PERIOD + 1, 'Net_CF_After'] +
-                self.static_invest * Constants.RESIDUAL_RATIO + working_capital],
-            '资本金投入(万元)': [-(capital_invest + working_capital * self.capital_ratio)] + [0] * Constants.OPERATION_PERIOD,
+            '年份': _YEAR_LABELS_WITH_CONSTRUCTION,
+            '现金流入(万元)': np.concatenate(([0.0], operating_cf)),
+            '资本金投入(万元)': [equity_outlay] + [0] * Constants.OPERATION_PERIOD,
             '借款本金偿还(万元)': [0] * (Constants.OPERATION_PERIOD + 1),
             '借款利息支付(万元)': [0] * (Constants.OPERATION_PERIOD + 1),
-            '现金流出(万元)': [-(capital_invest + working_capital * self.capital_ratio)] + [0] * Constants.OPERATION_PERIOD,
-            '净现金流量(万元)': [-(capital_invest + working_capital * self.capital_ratio)] + list(df.loc[2:, 'Net_CF_After'].values),
-            '累计净现金流量(万元)': [-(capital_invest + working_capital * self.capital_ratio)] + list(df.loc[2:, 'Net_CF_After'].cumsum().values),
+            '现金流出(万元)': [equity_outlay] + [0] * Constants.OPERATION_PERIOD,
+            '净现金流量(万元)': net_cf,
+            '累计净现金流量(万元)': np.cumsum(net_cf),
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"资本金现金流量表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("资本金现金流量表已保存到: %s", filename)
 
         return table
 
@@ -758,61 +1252,42 @@ class PVProject:
         Returns:
             资产负债表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        # 计算累计利润和资产
-        df = self.df[self.df.index >= 2].copy()
-
-        # 重新计算折旧
-        deductible_tax = self.p.get(
-            'deductible_tax',
-            self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-        )
-        const_interest = self.const_interest
-        fixed_asset_value = self.static_invest + const_interest - deductible_tax
-        depreciation_per_year = fixed_asset_value * Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS
-
         # 计算累计折旧
-        accumulated_depreciation = []
-        acc_dep = 0
-        for i in range(1, Constants.OPERATION_PERIOD + 1):
-            if i <= Constants.DEPRECIATION_YEARS:
-                acc_dep += depreciation_per_year
-            accumulated_depreciation.append(acc_dep)
+        accumulated_depreciation = np.cumsum(self._depreciation_schedule())
 
         # 计算累计利润
-        cumulative_profit = []
-        cum_profit = 0
-        for i in range(1, Constants.OPERATION_PERIOD + 1):
-            depreciation = depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
-            profit = df.loc[i + 1, 'Revenue_Exc'] - df.loc[i + 1, 'OM_Cost'] - df.loc[i + 1, 'Surtax'] - depreciation
-            after_tax_profit = profit - df.loc[i + 1, 'Income_Tax']
-            cum_profit += after_tax_profit
-            cumulative_profit.append(cum_profit)
+        cumulative_profit = np.cumsum(self._operating_profit() - self._arrays['Income_Tax'][1:])
+
+        # 资产与所有者权益 (假设按累计利润提取10%盈余公积)
+        current_assets = np.full(Constants.OPERATION_PERIOD, self.working_capital)
+        fixed_assets_net = self.fixed_asset_value - accumulated_depreciation
+        surplus_reserve = np.maximum(0.0, cumulative_profit * 0.1)
+        equity_total = self.capital_amount + surplus_reserve + cumulative_profit
 
         table = pd.DataFrame({
-            '年份': [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
+            '年份': _YEAR_LABELS,
             # 资产
-            '流动资产总额(万元)': [self.capacity * Constants.WORKING_CAPITAL_PER_MW] * Constants.OPERATION_PERIOD,
-            '固定资产净值(万元)': [fixed_asset_value - d for d in accumulated_depreciation],
-            '资产总额(万元)': [self.capacity * Constants.WORKING_CAPITAL_PER_MW + fixed_asset_value - d for d in accumulated_depreciation],
+            '流动资产总额(万元)': current_assets,
+            '固定资产净值(万元)': fixed_assets_net,
+            '资产总额(万元)': self.working_capital + fixed_assets_net,
             # 负债
             '流动负债(万元)': [0] * Constants.OPERATION_PERIOD,
             '长期借款(万元)': [0] * Constants.OPERATION_PERIOD,
             '负债合计(万元)': [0] * Constants.OPERATION_PERIOD,
             # 所有者权益
-            '资本金(万元)': [self.static_invest * self.capital_ratio] * Constants.OPERATION_PERIOD,
-            '累计盈余公积金(万元)': [max(0, p * 0.1) for p in cumulative_profit],  # 假设提取10%盈余公积
+            '资本金(万元)': np.full(Constants.OPERATION_PERIOD, self.capital_amount),
+            '累计盈余公积金(万元)': surplus_reserve,
             '累计未分配利润(万元)': cumulative_profit,
-            '所有者权益合计(万元)': [self.static_invest * self.capital_ratio + max(0, p * 0.1) + p for p in cumulative_profit],
-            '负债及所有者权益(万元)': [self.static_invest * self.capital_ratio + max(0, p * 0.1) + p
-                                      for p in cumulative_profit],
+            '所有者权益合计(万元)': equity_total,
+            '负债及所有者权益(万元)': equity_total,
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"资产负债表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("资产负债表已保存到: %s", filename)
 
         return table
 
@@ -826,22 +1301,26 @@ class PVProject:
         Returns:
             财务指标汇总表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
         metrics = self.get_metrics()
 
-        # 计算更多财务指标
-        df = self.df[self.df.index >= 2].copy()
+        # 计算更多财务指标 (运营期各列合计)
+        totals = {col: float(self._arrays[col][1:].sum())
+                  for col in ('Revenue_Exc', 'OM_Cost', 'Surtax', 'VAT_Payable', 'Income_Tax')}
 
         # 计算总投资收益率 (ROI)
-        total_profit = df['Revenue_Exc'].sum() - df['OM_Cost'].sum() - df['Surtax'].sum()
+        total_profit = totals['Revenue_Exc'] - totals['OM_Cost'] - totals['Surtax']
         roi = total_profit / self.total_invest * 100
 
         # 计算投资利税率
-        total_tax = df['VAT_Payable'].sum() + df['Surtax'].sum() + df['Income_Tax'].sum()
+        total_tax = totals['VAT_Payable'] + totals['Surtax'] + totals['Income_Tax']
         investment_profit_tax_rate = (total_profit + total_tax) / self.total_invest * 100
 
+        # 运营期累计净利润
+        total_net_profit = total_profit - totals['Income_Tax']
+
         table = pd.DataFrame({
             '指标': [
                 '项目总投资(万元)',
@@ -864,16 +1343,16 @@ class PVProject:
                 metrics['投资回收期(年)'],
                 round(roi, 2),
                 round(investment_profit_tax_rate, 2),
-                round(df['Revenue_Exc'].sum() - df['OM_Cost'].sum() - df['Surtax'].sum() - df['Income_Tax'].sum(), 2) / 25,
-                round(df['Revenue_Exc'].sum() - df['OM_Cost'].sum() - df['Surtax'].sum() - df['Income_Tax'].sum(), 2),
+                round(total_net_profit / Constants.OPERATION_PERIOD, 2),
+                round(total_net_profit, 2),
                 self.capacity,
                 round(self.static_invest / self.capacity * 10000, 2),
             ],
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"财务指标汇总表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("财务指标汇总表已保存到: %s", filename)
 
         return table
 
@@ -943,8 +1422,8 @@ class PVProject:
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"参数汇总表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("参数汇总表已保存到: %s", filename)
 
         return table
 
@@ -961,57 +1440,31 @@ class PVProject:
         Returns:
             EVA测算表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
-        df = self.df[self.df.index >= 2].copy()
-
-        # 计算税后净营业利润 (NOPAT)
-        deductible_tax = self.p.get(
-            'deductible_tax',
-            self.static_invest / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-        )
-        const_interest = self.const_interest
-        fixed_asset_value = self.static_invest + const_interest - deductible_tax
-        depreciation_per_year = fixed_asset_value * Constants.DEPRECIATION_BASE_RATIO / Constants.DEPRECIATION_YEARS
-
-        nopat_list = []
-        capital_list = []
-        eva_list = []
-
-        capital = self.total_invest  # 初始投资
-
-        for i in range(1, Constants.OPERATION_PERIOD + 1):
-            depreciation = depreciation_per_year if i <= Constants.DEPRECIATION_YEARS else 0
+        # 税后净营业利润 (NOPAT) = 利润总额 - 所得税
+        nopat = self._operating_profit() - self._arrays['Income_Tax'][1:]
 
-            # 税后净营业利润 = 净利润 + 利息支出(1-税率) + 所得税
-            profit = df.loc[i + 1, 'Revenue_Exc'] - df.loc[i + 1, 'OM_Cost'] - df.loc[i + 1, 'Surtax'] - depreciation
-            income_tax = df.loc[i + 1, 'Income_Tax']
-            nopat = profit - income_tax
+        # 资本占用 (年末) = 初始投资 - 累计折旧
+        capital = self.total_invest - np.cumsum(self._depreciation_schedule())
+        capital_cost = capital * wacc
 
-            nopat_list.append(nopat)
-
-            # 资本占用 (年末)
-            if i <= Constants.DEPRECIATION_YEARS:
-                capital = capital - depreciation_per_year
-            capital_list.append(capital)
-
-            # EVA = NOPAT - 资本占用 × WACC
-            eva = nopat - capital * wacc
-            eva_list.append(eva)
+        # EVA = NOPAT - 资本占用 × WACC
+        eva = nopat - capital_cost
 
         table = pd.DataFrame({
-            '年份': [f'第{i}年' for i in range(1, Constants.OPERATION_PERIOD + 1)],
-            '税后净营业利润(万元)': nopat_list,
-            '资本占用(万元)': capital_list,
-            '资本成本(万元)': [c * wacc for c in capital_list],
-            f'EVA(万元,WACC={wacc:.0%})': eva_list,
-            'EVA累计(万元)': pd.Series(eva_list).cumsum().tolist(),
+            '年份': _YEAR_LABELS,
+            '税后净营业利润(万元)': nopat,
+            '资本占用(万元)': capital,
+            '资本成本(万元)': capital_cost,
+            f'EVA(万元,WACC={wacc:.0%})': eva,
+            'EVA累计(万元)': np.cumsum(eva),
         })
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"EVA测算表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("EVA测算表已保存到: %s", filename)
 
         return table
 
@@ -1032,7 +1485,7 @@ class PVProject:
         Returns:
             敏感性汇总表 DataFrame
         """
-        if self.df is None:
+        if self._arrays is None:
             raise CalculationError("请先运行 calculate_cash_flow()")
 
         metrics = self.get_metrics()
@@ -1046,15 +1499,24 @@ class PVProject:
             else:
                 factors = ['static_invest', 'hours', 'price_tax_inc']
                 factor_names = ['静态投资', '利用小时数', '上网电价']
+        else:
+            factor_names = list(factors)  # 自定义因素以参数名作为显示名称
+
+        # 各因素按 -variation / 0 / +variation 三点扰动 (同 sensitivity_analysis 的 steps=3)，
+        # 全部方案一次性送入批量计算，不再逐因素组装敏感性分析表
+        variations = np.linspace(-variation, variation, 3)
+        scenarios = [
+            {**self.p, factor: value}
+            for factor in factors
+            for value in _sensitivity_base_value(self.p, factor) * (1 + variations)
+        ]
+        irr_grid = self.evaluate_batch(scenarios)['全投资IRR(税前)'].reshape(len(factors), 3)
 
         results = []
 
-        for factor, name in zip(factors, factor_names):
-            # 进行敏感性分析
-            sens_df = sensitivity_analysis(self.p, factor, variation_range=variation, steps=3)
-
-            # 提取关键信息
-            irr_values = sens_df['IRR(税前)%'].dropna().values
+        for name, factor_irrs in zip(factor_names, irr_grid):
+            # 提取关键信息 (与敏感性分析表一致，IRR 保留两位小数，剔除计算失败的方案)
+            irr_values = np.array([round(float(irr), 2) for irr in factor_irrs if not np.isnan(irr)])
             if len(irr_values) >= 2:
                 irr_max = irr_values.max()
                 irr_min = irr_values.min()
@@ -1079,8 +1541,8 @@ class PVProject:
         table = pd.DataFrame(results)
 
         if filename:
-            table.to_csv(filename, index=False, encoding='utf-8-sig')
-            logger.info(f"敏感性汇总表已保存到: {filename}")
+            _write_csv(table, filename)
+            logger.info("敏感性汇总表已保存到: %s", filename)
 
         return table
 
@@ -1089,6 +1551,32 @@ class PVProject:
 # 敏感性分析
 # ==============================================================================
 
+def _sensitivity_base_value(base_params: Dict[str, Any], factor: str) -> float:
+    """
+    取敏感性因素的基准值
+
+    Args:
+        base_params: 基础项目参数
+        factor: 敏感性因素 (参数名或其别名)
+
+    Returns:
+        因素基准值
+
+    Raises:
+        ValueError: 未知的因素
+    """
+    base_value = base_params.get(factor)
+    if base_value is None:
+        # 处理参数名映射
+        if factor in ['price', 'price_tax_inc']:
+            base_value = base_params.get('price_tax_inc')
+        elif factor in ['hours', 'gen_hours']:
+            base_value = base_params.get('hours', 1000)
+        else:
+            raise ValueError(f"未知的因素: {factor}")
+    return base_value
+
+
 def sensitivity_analysis(
     base_params: Dict[str, Any],
     factor: str,
@@ -1115,65 +1603,49 @@ def sensitivity_analysis(
     Returns:
         敏感性分析结果 DataFrame
     """
-    results = []
-
-    # 获取基准值
-    base_value = base_params.get(factor)
-    if base_value is None:
-        # 处理参数名映射
-        if factor in ['price', 'price_tax_inc']:
-            base_value = base_params.get('price_tax_inc')
-        elif factor in ['hours', 'gen_hours']:
-            base_value = base_params.get('hours', 1000)
-        else:
-            raise ValueError(f"未知的因素: {factor}")
-
     # 生成变化序列
     variations = np.linspace(-variation_range, variation_range, steps)
-
-    for var in variations:
-        params_temp = base_params.copy()
-        new_value = base_value * (1 + var)
+    new_values = _sensitivity_base_value(base_params, factor) * (1 + variations)
+
+    # 逐个方案校验参数，合法方案的现金流汇总为 (N, 26) 矩阵一次性计算
+    # PVProject 初始化时自行复制参数，各方案共用一份副本，只改写被分析的因素
+    kernel_inputs = []
+    valid = np.zeros(steps, dtype=bool)
+    params_temp = base_params.copy()
+    for i, (var, new_value) in enumerate(zip(variations, new_values)):
         params_temp[factor] = new_value
-
-        # 如果是自发自用模式，需要特殊处理
-        if factor == 'retail_price' or factor == 'feedin_price' or factor == 'self_consumption_ratio':
-            params_temp[factor] = new_value
-
         try:
-            project = PVProject(params_temp)
-            project.calculate_cash_flow()
-            metrics = project.get_metrics()
-            irr = metrics['全投资IRR(税前)']
-
-            results.append({
-                '因素': factor,
-                '变化率': f'{var*100:+.1f}%',
-                '数值': new_value,
-                'IRR(税前)%': irr,
-                'IRR变化': f"{irr - metrics['全投资IRR(税前)']:+.2f}" if var == 0 else f""
-            })
+            kernel_inputs.append(PVProject(params_temp)._kernel_inputs())
+            valid[i] = True
         except Exception as e:
-            logger.error(f"敏感性分析失败 (变化率={var*100:.1f}%): {e}")
-            results.append({
-                '因素': factor,
-                '变化率': f'{var*100:+.1f}%',
-                '数值': new_value,
-                'IRR(税前)%': None,
-                'IRR变化': "计算失败"
-            })
-
-    df = pd.DataFrame(results)
-
-    # 计算敏感度系数
-    if len(df) > 0 and df['IRR(税前)%'].notna().sum() >= 2:
-        base_irr = df.loc[df['变化率'] == '0.0%', 'IRR(税前)%'].values[0] if '0.0%' in df['变化率'].values else df['IRR(税前)%'].values[len(df)//2]
-        df['敏感度系数'] = df.apply(lambda row: (
-            (row['IRR(税前)%'] - base_irr) / base_irr / (float(row['变化率'].replace('%', '')) / 100)
-            if row['IRR(税前)%'] is not None and row['变化率'] != '0.0%' else 0.0
-        ), axis=1)
-
-    logger.info(f"敏感性分析完成: 因素={factor}")
+            logger.error("敏感性分析失败 (变化率=%.1f%%): %s", var * 100, e)
+
+    irrs = np.full(steps, np.nan)
+    if kernel_inputs:
+        arrays = _cash_flow_kernel(*np.array(kernel_inputs).T)
+        irrs[valid] = _irr_rows(arrays['Net_CF_Pre']) * 100
+
+    # 各列直接由方案数组生成，计算失败的方案 IRR 为 nan
+    irr_values = np.array([round(float(irr), 2) if ok else np.nan for ok, irr in zip(valid, irrs)])
+    columns = {
+        '因素': [factor] * steps,
+        '变化率': [f'{var*100:+.1f}%' for var in variations],
+        '数值': new_values,
+        'IRR(税前)%': irr_values,
+        'IRR变化': [("+0.00" if var == 0 else "") if ok else "计算失败" for var, ok in zip(variations, valid)],
+    }
+
+    # 计算敏感度系数 (基准方案与计算失败的方案记为0)
+    if np.count_nonzero(~np.isnan(irr_values)) >= 2:
+        base_rows = np.flatnonzero(variations == 0)
+        base_irr = irr_values[base_rows[0] if base_rows.size else steps // 2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coefficient = (irr_values - base_irr) / base_irr / variations
+        columns['敏感度系数'] = np.where(valid & (variations != 0), coefficient, 0.0)
+
+    df = pd.DataFrame(columns)
+
+    logger.info("敏感性分析完成: 因素=%s", factor)
     return df
 
 
@@ -1181,6 +1653,127 @@ def sensitivity_analysis(
 # 高级功能: 反向求解 (Goal Seek)
 # ==============================================================================
 
+def _secant_solve(
+    func,
+    x0: float,
+    x1: float,
+    xtol: float = Constants.GOAL_SEEK_XTOL,
+    maxiter: int = 30
+) -> Optional[float]:
+    """
+    割线法求解 func(x) = 0
+
+    Args:
+        func: 目标函数
+        x0, x1: 两个初始点
+        xtol: 收敛判据 |x_{n+1} - x_n| < xtol，默认 Constants.GOAL_SEEK_XTOL
+        maxiter: 最大迭代次数
+
+    Returns:
+        根的近似值，不收敛或出现非正试探点时返回 None
+    """
+    f0, f1 = func(x0), func(x1)
+    for _ in range(maxiter):
+        if f1 == 0:
+            return x1
+        if f1 == f0:
+            return None
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        if not np.isfinite(x2) or x2 <= 0:
+            return None
+        if abs(x2 - x1) < xtol:
+            return x2
+        x0, f0 = x1, f1
+        x1, f1 = x2, func(x2)
+    return None
+
+
+def _search_brackets(
+    x0: float,
+    min_invest: Optional[float],
+    max_invest: Optional[float]
+) -> List[Tuple[float, float]]:
+    """
+    生成反向求解的搜索区间序列 (由窄到宽，最后一项为允许的结果范围)
+
+    未指定上下限时按当前静态投资自适应: 先取 [0.3, 3] 倍，
+    再扩展至 [0.1, 10] 倍并覆盖 [MIN_INVEST, MAX_INVEST]，使小型分布式项目也能求解。
+
+    Args:
+        x0: 当前静态投资 (万元)
+        min_invest, max_invest: 用户指定的搜索上下限 (万元)，可为 None
+    """
+    if min_invest is None and max_invest is None:
+        return [
+            (0.3 * x0, 3.0 * x0),
+            (min(Constants.MIN_INVEST, 0.1 * x0), max(Constants.MAX_INVEST, 10.0 * x0)),
+        ]
+    return [(min_invest or Constants.MIN_INVEST, max_invest or Constants.MAX_INVEST)]
+
+
+def _bracketed_solve(
+    func,
+    x0: float,
+    target_irr: float,
+    brackets: List[Tuple[float, float]]
+) -> float:
+    """
+    Brentq 区间法求解 func(x) = 0，优先使用按 IRR ∝ 1/投资 估算的窄区间
+
+    Args:
+        func: 目标函数 (IRR - 目标IRR)
+        x0: 当前静态投资
+        target_irr: 目标IRR (%)
+        brackets: 由 _search_brackets 生成的区间序列，依次尝试
+
+    Returns:
+        根的近似值，精确到 Constants.GOAL_SEEK_XTOL
+
+    Raises:
+        ValueError: 所有区间两端均同号 (无解)
+    """
+    from scipy import optimize  # 仅割线法失败时需要，延迟导入以缩短模块加载时间
+
+    min_inv, max_inv = brackets[-1]
+    candidates = list(brackets)
+    base_irr = func(x0) + target_irr
+    if target_irr > 0 and np.isfinite(base_irr) and base_irr > 0:
+        estimate = x0 * base_irr / target_irr
+        candidates.insert(0, (max(min_inv, 0.7 * estimate), min(max_inv, 1.4 * estimate)))
+
+    for lower, upper in candidates:
+        if lower < upper:
+            try:
+                # 最宽区间 (约 10 倍静态投资) 二分至 GOAL_SEEK_XTOL 最多约需 35 步，maxiter 留有余量
+                return optimize.brentq(func, lower, upper, xtol=Constants.GOAL_SEEK_XTOL, maxiter=50)
+            except ValueError:
+                pass
+    raise ValueError(f"在范围[{min_inv}, {max_inv}]内无解")
+
+
+def _goal_seek_objective(project: PVProject, target_irr: float, irr_memo: Dict[float, float]):
+    """
+    生成反向求解的目标函数 IRR(静态投资) - 目标IRR
+
+    goal_seek_investment 与 goal_seek_investment_batch 的区间法回退共用，
+    保证两者对同一目标求得相同的解。
+
+    Args:
+        project: 本次反向求解所用的项目实例
+        target_irr: 目标IRR (%)
+        irr_memo: 本次求解内的 IRR 记忆表 (静态投资 -> 全投资IRR(税前))，
+                  由调用方创建，不跨调用保留，结果不依赖此前的调用
+    """
+    def objective(invest_guess: float) -> float:
+        invest_guess = float(invest_guess)
+        irr = irr_memo.get(invest_guess)
+        if irr is None:
+            irr = irr_memo[invest_guess] = project.recompute(invest_guess)
+        return irr - target_irr
+
+    return objective
+
+
 def goal_seek_investment(
     target_irr: float,
     params: Dict[str, Any],
@@ -1190,46 +1783,151 @@ def goal_seek_investment(
     """
     给定目标IRR，反推最大允许的静态投资
 
-    使用 Scipy Brentq 算法进行快速求解
+    IRR 随静态投资单调且近似线性变化，先以当前静态投资为初值用割线法求解
+    (通常 4~6 次现金流计算即可收敛)，失败时退回 Scipy Brentq 区间法
+    (先在估算解附近的窄区间内求解，再逐级放宽搜索区间)。
 
     Args:
         target_irr: 目标全投资IRR (税前)，如 8.0 表示 8%
         params: 项目参数字典
-        min_invest: 搜索下限 (万元)，默认1000
-        max_invest: 搜索上限 (万元)，默认100000
+        min_invest: 搜索下限 (万元)，默认按当前静态投资自适应 (见 _search_brackets)
+        max_invest: 搜索上限 (万元)，默认按当前静态投资自适应
 
     Returns:
-        最大允许静态投资 (万元)，如果求解失败则返回 None
+        最大允许静态投资 (万元)，精确到 Constants.GOAL_SEEK_XTOL (1e-4 万元，即 1 元)，
+        远小于报告精度 0.01 万元；如果求解失败则返回 None
     """
-    min_inv = min_invest or Constants.MIN_INVEST
-    max_inv = max_invest or Constants.MAX_INVEST
-
-    def objective(invest_guess: float) -> float:
-        p_temp = params.copy()
-        p_temp['static_invest'] = invest_guess
-
-        if 'deductible_tax' not in p_temp:
-            p_temp['deductible_tax'] = (
-                invest_guess / (1 + Constants.VAT_RATE) * Constants.VAT_RATE
-            )
-
-        project = PVProject(p_temp)
-        project.calculate_cash_flow()
-        metrics = project.get_metrics()
-        return metrics['全投资IRR(税前)'] - target_irr
+    x0 = float(params.get('static_invest', (
+        (min_invest or Constants.MIN_INVEST) + (max_invest or Constants.MAX_INVEST)
+    ) / 2))
+    brackets = _search_brackets(x0, min_invest, max_invest)
+    min_inv, max_inv = brackets[-1]
 
     try:
-        limit_invest = optimize.brentq(objective, min_inv, max_inv)
-        logger.info(f"Goal Seek 成功: 目标IRR={target_irr}% -> 最大投资={limit_invest:.2f}万元")
+        # 项目实例仅在本次求解内使用，各次迭代只修改其静态投资
+        # (可抵扣进项税未给定时由项目按静态投资自动估算)
+        project = PVProject({**params, 'static_invest': x0})
+        objective = _goal_seek_objective(project, target_irr, {})
+        limit_invest = _secant_solve(objective, x0, x0 * 1.2)
+        if limit_invest is None or not min_inv <= limit_invest <= max_inv:
+            limit_invest = _bracketed_solve(objective, x0, target_irr, brackets)
+        logger.info("Goal Seek 成功: 目标IRR=%s%% -> 最大投资=%.2f万元", target_irr, limit_invest)
         return limit_invest
-    except ValueError as e:
-        logger.error(f"Goal Seek 失败: 目标IRR {target_irr}% 在范围[{min_inv}, {max_inv}]内无解")
+    except ValueError:
+        logger.error("Goal Seek 失败: 目标IRR %s%% 在范围[%s, %s]内无解", target_irr, min_inv, max_inv)
         return None
     except Exception as e:
-        logger.error(f"Goal Seek 失败: {e}")
+        logger.error("Goal Seek 失败: %s", e)
         return None
 
 
+def goal_seek_investment_batch(
+    target_irrs: np.ndarray,
+    params: Dict[str, Any],
+    min_invest: Optional[float] = None,
+    max_invest: Optional[float] = None
+) -> np.ndarray:
+    """
+    给定一组目标IRR，批量反推各自最大允许的静态投资
+
+    对所有目标同时执行向量化割线迭代，每步以 PVProject.sweep_static_invest
+    一次性计算全部候选投资的IRR；收敛判据与 goal_seek_investment 相同，
+    未收敛或超出搜索范围的目标同样逐个退回 Brentq 区间法 (_bracketed_solve)。
+
+    Args:
+        target_irrs: 目标全投资IRR (税前) 数组，如 [6.0, 8.0, 10.0]
+        params: 项目参数字典
+        min_invest: 搜索下限 (万元)，默认按当前静态投资自适应 (见 _search_brackets)
+        max_invest: 搜索上限 (万元)，默认按当前静态投资自适应
+
+    Returns:
+        与 target_irrs 等长的最大允许静态投资数组 (万元)，求解失败的目标为 nan
+    """
+    targets = np.atleast_1d(np.asarray(target_irrs, dtype=np.float64))
+    result = np.full(targets.shape, np.nan)
+
+    x0 = float(params.get('static_invest', (
+        (min_invest or Constants.MIN_INVEST) + (max_invest or Constants.MAX_INVEST)
+    ) / 2))
+    brackets = _search_brackets(x0, min_invest, max_invest)
+    min_inv, max_inv = brackets[-1]
+    try:
+        # 两个初始点对所有目标相同，各只需计算一次IRR
+        project = PVProject({**params, 'static_invest': x0})
+        x_prev, x = np.full(targets.shape, x0), np.full(targets.shape, x0 * 1.2)
+        f_prev = project.sweep_static_invest(x0) - targets
+        f = project.sweep_static_invest(x0 * 1.2) - targets
+    except Exception as e:
+        logger.error("Goal Seek 失败: %s", e)
+        return result
+
+    # 收敛判据与 _secant_solve 相同: 恰为根，或割线步长小于 GOAL_SEEK_XTOL
+    active = np.ones(targets.shape, dtype=bool)
+    for _ in range(30):
+        root = active & (f == 0)
+        result[root] = x[root]
+        active &= ~root
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_next = x - f * (x - x_prev) / (f - f_prev)
+        active &= np.isfinite(x_next) & (x_next > 0)
+        done = active & (np.abs(x_next - x) < Constants.GOAL_SEEK_XTOL)
+        result[done] = x_next[done]
+        active &= ~done
+        if not active.any():
+            break
+
+        x_prev, f_prev = x, f
+        x, f = np.where(active, x_next, x), f.copy()
+        f[active] = project.sweep_static_invest(x[active]) - targets[active]
+
+    irr_memo: Dict[float, float] = {}  # 区间法回退的各目标共用同一项目，IRR 可互相复用
+    for i in np.flatnonzero(~((result >= min_inv) & (result <= max_inv))):
+        target_irr = float(targets[i])
+        result[i] = np.nan
+        try:
+            objective = _goal_seek_objective(project, target_irr, irr_memo)
+            result[i] = _bracketed_solve(objective, x0, target_irr, brackets)
+        except ValueError:
+            logger.error("Goal Seek 失败: 目标IRR %s%% 在范围[%s, %s]内无解", target_irr, min_inv, max_inv)
+        except Exception as e:
+            logger.error("Goal Seek 失败: %s", e)
+
+    logger.info("批量 Goal Seek 完成: %d 个目标IRR", len(targets))
+    return result
+
+
+def _goal_seek_job(job: Tuple[float, Dict[str, Any]]) -> Optional[float]:
+    """goal_seek_parallel 的工作进程入口 (须为模块级函数以便 pickle)"""
+    target_irr, params = job
+    return goal_seek_investment(target_irr, params)
+
+
+def goal_seek_parallel(
+    jobs: List[Tuple[float, Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[Optional[float]]:
+    """
+    多进程并行执行多组 (目标IRR, 项目参数) 的反向求解
+
+    各任务相互独立且为 CPU 密集型，适用于蒙特卡洛等大批量参数扫描；
+    单次求解仅需亚毫秒级，任务较少时进程启动开销会超过收益，宜直接串行调用。
+
+    Args:
+        jobs: (目标IRR, 项目参数字典) 列表
+        max_workers: 工作进程数，默认为 CPU 核数
+        chunksize: 每次分派给工作进程的任务数
+
+    Returns:
+        与 jobs 顺序一致的最大允许静态投资列表 (万元)，求解失败的任务为 None
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_goal_seek_job, jobs, chunksize=chunksize))
+
+
 # ==============================================================================
 # 演示与测试
 # ==============================================================================
@@ -1243,10 +1941,6 @@ def demo_qionghai_project() -> None:
         - 总投资: 41080.18 万元
         - 全投资IRR(税前): 11.35%
     """
-    print("\n" + "=" * 60)
-    print("🌟 PyPV-Eval v1.1.0 - 光伏项目技经评价引擎")
-    print("=" * 60)
-
     qionghai_params = {
         'capacity_mw': 100.0,
         'static_invest': 40000.0,
@@ -1257,35 +1951,45 @@ def demo_qionghai_project() -> None:
         'deductible_tax': 4000.0
     }
 
+    # 报告逐行收集，计算结束后一次性输出
+    lines = [
+        "\n" + "=" * 60,
+        "🌟 PyPV-Eval v1.1.0 - 光伏项目技经评价引擎",
+        "=" * 60,
+        "\n📊 正在执行琼海项目 (100MW) 计算...",
+    ]
     try:
-        print("\n📊 正在执行琼海项目 (100MW) 计算...")
         project = PVProject(qionghai_params)
         project.calculate_cash_flow()
         metrics = project.get_metrics()
 
-        print("\n" + "-" * 60)
-        print("✅ 琼海项目 (100MW) 技经评价报告")
-        print("-" * 60)
-        print(f"💰 项目总投资:      {metrics['总投资']:>12} 万元")
-        print(f"🏗️  建设期利息:     {metrics['建设期利息']:>12} 万元  (对标: 780.18)")
-        print(f"📈 IRR (税前):      {metrics['全投资IRR(税前)']:>12}%       (对标: 11.35%)")
-        print(f"📉 IRR (税后):      {metrics['全投资IRR(税后)']:>12}%")
-        print(f"📅 投资回收期:      {metrics['投资回收期(年)']:>12} 年")
-        print("-" * 60)
+        lines += [
+            "\n" + "-" * 60,
+            "✅ 琼海项目 (100MW) 技经评价报告",
+            "-" * 60,
+            f"💰 项目总投资:      {metrics['总投资']:>12} 万元",
+            f"🏗️  建设期利息:     {metrics['建设期利息']:>12} 万元  (对标: 780.18)",
+            f"📈 IRR (税前):      {metrics['全投资IRR(税前)']:>12}%       (对标: 11.35%)",
+            f"📉 IRR (税后):      {metrics['全投资IRR(税后)']:>12}%",
+            f"📅 投资回收期:      {metrics['投资回收期(年)']:>12} 年",
+            "-" * 60,
+        ]
 
         # 反向求解演示
         target = 8.0
-        print(f"\n🔮 [决策辅助] 若目标 IRR 为 {target}%:")
+        lines.append(f"\n🔮 [决策辅助] 若目标 IRR 为 {target}%:")
         limit = goal_seek_investment(target, qionghai_params)
         if limit is not None:
-            print(f"👉 最大允许静态投资:  {limit:>10.2f} 万元")
-            print(f"👉 相比当前方案盈余:  {limit - 40000:>10.2f} 万元")
-        print("=" * 60)
+            lines.append(f"👉 最大允许静态投资:  {limit:>10.2f} 万元")
+            lines.append(f"👉 相比当前方案盈余:  {limit - 40000:>10.2f} 万元")
+        lines.append("=" * 60)
 
     except (InputValidationError, CalculationError) as e:
-        print(f"\n❌ 错误: {e}")
+        lines.append(f"\n❌ 错误: {e}")
     except Exception as e:
-        print(f"\n❌ 未知错误: {e}")
+        lines.append(f"\n❌ 未知错误: {e}")
+    finally:
+        print("\n".join(lines))
 
 
 def demo_self_consumption_project() -> None:
@@ -1298,10 +2002,6 @@ def demo_self_consumption_project() -> None:
         - 工商业电价 0.8 元/kWh
         - 余电上网电价 0.4 元/kWh
     """
-    print("\n" + "=" * 60)
-    print("🏢 工商业分布式光伏项目演示（自发自用模式）")
-    print("=" * 60)
-
     distributed_params = {
         'capacity_mw': 1.0,              # 1MW
         'static_invest': 350.0,           # 350万元（约3.5元/W）
@@ -1314,44 +2014,59 @@ def demo_self_consumption_project() -> None:
         'loan_rate': 0.04,
     }
 
+    # 报告逐行收集，计算结束后一次性输出
+    lines = [
+        "\n" + "=" * 60,
+        "🏢 工商业分布式光伏项目演示（自发自用模式）",
+        "=" * 60,
+    ]
     try:
-        print("\n📊 项目参数:")
-        print(f"   装机容量: {distributed_params['capacity_mw']} MW")
-        print(f"   静态投资: {distributed_params['static_invest']} 万元")
-        print(f"   自用比例: {distributed_params['self_consumption_ratio']:.0%}")
-        print(f"   零售电价: {distributed_params['retail_price']} 元/kWh")
-        print(f"   上网电价: {distributed_params['feedin_price']} 元/kWh")
+        lines += [
+            "\n📊 项目参数:",
+            f"   装机容量: {distributed_params['capacity_mw']} MW",
+            f"   静态投资: {distributed_params['static_invest']} 万元",
+            f"   自用比例: {distributed_params['self_consumption_ratio']:.0%}",
+            f"   零售电价: {distributed_params['retail_price']} 元/kWh",
+            f"   上网电价: {distributed_params['feedin_price']} 元/kWh",
+        ]
 
         project = PVProject(distributed_params)
         project.calculate_cash_flow()
         metrics = project.get_metrics()
 
-        print("\n" + "-" * 60)
-        print("✅ 工商业分布式项目技经评价报告")
-        print("-" * 60)
-        print(f"💰 项目总投资:      {metrics['总投资']:>12} 万元")
-        print(f"🏗️  建设期利息:     {metrics['建设期利息']:>12} 万元")
-        print(f"📈 IRR (税前):      {metrics['全投资IRR(税前)']:>12}%")
-        print(f"📉 IRR (税后):      {metrics['全投资IRR(税后)']:>12}%")
-        print(f"📅 投资回收期:      {metrics['投资回收期(年)']:>12} 年")
-        print("-" * 60)
+        lines += [
+            "\n" + "-" * 60,
+            "✅ 工商业分布式项目技经评价报告",
+            "-" * 60,
+            f"💰 项目总投资:      {metrics['总投资']:>12} 万元",
+            f"🏗️  建设期利息:     {metrics['建设期利息']:>12} 万元",
+            f"📈 IRR (税前):      {metrics['全投资IRR(税前)']:>12}%",
+            f"📉 IRR (税后):      {metrics['全投资IRR(税后)']:>12}%",
+            f"📅 投资回收期:      {metrics['投资回收期(年)']:>12} 年",
+            "-" * 60,
+        ]
 
         # 反向求解演示
         target = 12.0  # 分布式项目目标IRR通常较高
-        print(f"\n🔮 [决策辅助] 若目标 IRR 为 {target}%:")
+        lines.append(f"\n🔮 [决策辅助] 若目标 IRR 为 {target}%:")
         limit = goal_seek_investment(target, distributed_params)
         if limit is not None:
-            print(f"👉 最大允许静态投资:  {limit:>10.2f} 万元")
-            print(f"👉 相比当前方案盈余:  {limit - distributed_params['static_invest']:>10.2f} 万元")
-        print("=" * 60)
+            lines.append(f"👉 最大允许静态投资:  {limit:>10.2f} 万元")
+            lines.append(f"👉 相比当前方案盈余:  {limit - distributed_params['static_invest']:>10.2f} 万元")
+        lines.append("=" * 60)
 
     except (InputValidationError, CalculationError) as e:
-        print(f"\n❌ 错误: {e}")
+        lines.append(f"\n❌ 错误: {e}")
     except Exception as e:
-        print(f"\n❌ 未知错误: {e}")
+        lines.append(f"\n❌ 未知错误: {e}")
+    finally:
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
+    # 配置日志 (仅作为脚本运行时；作为库导入时由调用方决定日志输出)
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
     # 运行两个演示
     demo_qionghai_project()
     demo_self_consumption_project()
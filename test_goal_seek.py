@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+反向求解 (Goal Seek) 测试
+
+运行方法:
+    python -m pytest test_goal_seek.py
+"""
+
+import numpy as np
+import pytest
+
+from main import goal_seek_investment, goal_seek_investment_batch
+
+
+# 结果的报告精度 (万元)
+REPORT_PRECISION = 0.01
+
+PROJECTS = {
+    # 琼海 100MW 集中式光伏 (全额上网)
+    'qionghai': {
+        'capacity_mw': 100.0,
+        'static_invest': 40000.0,
+        'capital_ratio': 0.20,
+        'loan_rate': 0.04876,
+        'hours': 1500,
+        'price_tax_inc': 0.40,
+        'deductible_tax': 4000.0,
+    },
+    # 1MW 工商业分布式光伏 (自发自用)
+    'self_consumption': {
+        'capacity_mw': 1.0,
+        'static_invest': 350.0,
+        'mode': 'self_consumption',
+        'self_consumption_ratio': 0.8,
+        'retail_price': 0.85,
+        'feedin_price': 0.42,
+        'hours': 1100,
+        'capital_ratio': 0.3,
+        'loan_rate': 0.04,
+    },
+    # 可抵扣进项税按静态投资自动估算
+    'auto_deductible_tax': {
+        'capacity_mw': 10.0,
+        'static_invest': 3500.0,
+        'price_tax_inc': 0.38,
+        'hours': 1300,
+    },
+}
+
+# 含割线法收敛、区间法回退与无解 (80%) 的目标IRR
+TARGET_IRRS = (2.0, 6.0, 8.0, 10.0, 12.0, 80.0)
+
+
+@pytest.mark.parametrize('name', PROJECTS)
+def test_batch_matches_scalar(name):
+    """批量反向求解与逐个反向求解的结果在报告精度内一致 (或均无解)"""
+    params = PROJECTS[name]
+    batch = goal_seek_investment_batch(TARGET_IRRS, params)
+
+    for target_irr, batch_invest in zip(TARGET_IRRS, batch):
+        invest = goal_seek_investment(target_irr, params)
+        if invest is None:
+            assert np.isnan(batch_invest), target_irr
+        else:
+            assert abs(invest - batch_invest) < REPORT_PRECISION / 2, target_irr